@@ -0,0 +1,87 @@
+"""
+Persistent API response cache for the CSV enrichment pipeline
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from typing import Awaitable, Callable, Dict
+
+import aiosqlite
+import orjson
+
+from db_pool import AsyncConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+class ApiResponseCache:
+    """API responses stored in the api_cache table so resumed runs skip paid calls"""
+    
+    def __init__(self, pool: AsyncConnectionPool):
+        self.pool = pool
+        self._inflight: Dict[str, asyncio.Future] = {}  # In-flight calls, keyed provider:key
+    
+    @staticmethod
+    async def create_table(conn: aiosqlite.Connection):
+        """Create the api_cache table if it does not exist yet"""
+        await conn.execute(
+            "CREATE TABLE IF NOT EXISTS api_cache ("
+            "provider TEXT NOT NULL, key TEXT NOT NULL, response BLOB NOT NULL, "
+            "ts INTEGER NOT NULL, PRIMARY KEY (provider, key))"
+        )
+    
+    async def call(self, provider: str, key: str, fn: Callable[[], Awaitable[Dict]]) -> Dict:
+        """Return a cached API response, calling fn and storing its result on a miss
+        
+        Concurrent calls for the same key share one in-flight request; later
+        calls are served from the api_cache table.
+        """
+        flight_key = f"{provider}:{key}"
+        future = self._inflight.get(flight_key)
+        if future is not None:
+            # Reason: shield so a cancelled waiter cannot cancel the shared request
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            result = await self._fetch(provider, key, fn)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Mark retrieved; waiters (if any) re-raise it
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            # Only in-flight requests are shared; payloads are not kept in
+            # memory, so memory stays flat however many contacts are enriched
+            del self._inflight[flight_key]
+    
+    async def _fetch(self, provider: str, key: str, fn: Callable[[], Awaitable[Dict]]) -> Dict:
+        """Look a response up in the api_cache table, calling fn on a miss"""
+        async with self.pool.connection() as conn:
+            cursor = await conn.execute(
+                "SELECT response FROM api_cache WHERE provider = ? AND key = ?", (provider, key)
+            )
+            row = await cursor.fetchone()
+        if row is not None:
+            logger.debug(f"💾 Cache hit for {provider}:{key}")
+            return orjson.loads(row[0])
+        
+        result = await fn()
+        try:
+            async with self.pool.connection() as conn:
+                await conn.execute(
+                    "INSERT OR REPLACE INTO api_cache VALUES (?, ?, ?, ?)",
+                    (provider, key, orjson.dumps(result), int(time.time()))
+                )
+        except (sqlite3.Error, orjson.JSONEncodeError) as e:
+            # Reason: a cache write failure must not cost a paid result
+            logger.warning(f"⚠️  Could not cache {provider} response: {e}")
+        return result
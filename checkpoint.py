@@ -0,0 +1,69 @@
+"""
+Crash-safe progress snapshots for the CSV enrichment pipeline
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import orjson
+
+# Number of rotating progress snapshots kept on disk
+PROGRESS_SLOTS = 3
+
+
+def atomic_write(path: Path, data: bytes):
+    """Replace a file so readers see either the old or the new contents"""
+    # Write to a temp file, fsync it and swap it into place, so a crash
+    # mid-write never leaves a truncated file behind
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class ProgressRing:
+    """Rotating progress snapshots; the newest readable one wins on load"""
+    
+    def __init__(self, progress_file: Path, slots: int = PROGRESS_SLOTS):
+        self.progress_file = progress_file
+        self.slots = slots
+        self.sequence = 0  # Sequence number of the next snapshot
+    
+    def slot(self, sequence: int) -> Path:
+        """Ring-buffer snapshot path for a checkpoint sequence number"""
+        return self.progress_file.with_suffix(f".{sequence % self.slots}.json")
+    
+    def claim(self) -> Tuple[int, Path]:
+        """Reserve the next sequence number and the slot it is written to"""
+        sequence = self.sequence
+        self.sequence += 1
+        return sequence, self.slot(sequence)
+    
+    @staticmethod
+    def write(slot_path: Path, progress: Dict):
+        """Serialize a snapshot into its ring slot (blocking; run it in a thread)"""
+        atomic_write(slot_path, orjson.dumps(progress, option=orjson.OPT_INDENT_2))
+    
+    def load(self) -> Optional[Dict]:
+        """Load the newest readable snapshot and continue numbering after it"""
+        snapshots = []
+        for slot in range(self.slots):
+            try:
+                with open(self.slot(slot), 'rb') as f:
+                    snapshots.append(orjson.loads(f.read()))
+            except (OSError, orjson.JSONDecodeError):
+                continue
+        
+        if snapshots:
+            latest = max(snapshots, key=lambda p: p.get('sequence', -1))
+            self.sequence = latest.get('sequence', -1) + 1
+            return latest
+        
+        # Fall back to the single-file format written by older runs
+        if self.progress_file.exists():
+            with open(self.progress_file, 'rb') as f:
+                return orjson.loads(f.read())
+        return None
@@ -0,0 +1,53 @@
+"""
+Async connection pool for aiosqlite, shared by the CSV enrichment pipeline
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+import aiosqlite
+
+
+class AsyncConnectionPool:
+    """Reusable aiosqlite connections, so pragmas and page cache stay warm"""
+    
+    def __init__(self, connection_factory: Callable[[], Awaitable[aiosqlite.Connection]],
+                 min_size: int = 2, max_size: int = 8):
+        self._factory = connection_factory
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._size = 0
+    
+    async def _new_connection(self) -> aiosqlite.Connection:
+        self._size += 1  # Reserve the slot before awaiting so the pool never overshoots
+        try:
+            return await self._factory()
+        except BaseException:
+            # Reason: includes CancelledError, or a cancelled open leaks its slot
+            self._size -= 1
+            raise
+    
+    async def open(self):
+        """Create the minimum number of connections up front"""
+        for _ in range(self.min_size):
+            self._idle.put_nowait(await self._new_connection())
+    
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a connection, growing the pool up to max_size on demand"""
+        if self._idle.empty() and self._size < self.max_size:
+            conn = await self._new_connection()
+        else:
+            conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put_nowait(conn)
+    
+    async def close(self):
+        """Close every idle connection"""
+        while not self._idle.empty():
+            await self._idle.get_nowait().close()
+            self._size -= 1
@@ -5,6 +5,7 @@ Includes:
 - Cost tracking with budget limits
 - Retry logic for API failures
 - Enhanced rate limiting
+- Concurrent batch processing
 - Database backup
 - Better error handling
 """
@@ -14,33 +15,104 @@ import csv
 import sqlite3
 import sys
 import os
-import json
-import shutil
+import orjson
+import hashlib
+import inspect
 import time
 from datetime import datetime
 import logging
-from typing import List, Dict, Optional
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Dict, Iterator, Optional, Set, Tuple
+from itertools import islice
 from pathlib import Path
-from collections import deque
 from dataclasses import dataclass
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import httpx
+import aiosqlite
+from aiolimiter import AsyncLimiter
+from watchfiles import awatch
 from dotenv import load_dotenv
 
+from api_cache import ApiResponseCache
+from checkpoint import ProgressRing
+from db_pool import AsyncConnectionPool
+
+try:
+    import uvloop  # Optional: faster libuv-based event loop
+except ImportError:
+    uvloop = None
+
 # Load environment variables
 load_dotenv()
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Operator-facing progress and status lines (plain stdout, silenced by --quiet)
+progress_log = logging.getLogger("enrich")
+# Final run summary: its own level keeps it visible under --quiet
+summary_log = logging.getLogger("enrich.summary")
+summary_log.setLevel(logging.INFO)
+
+_log_listener: Optional[QueueListener] = None
+
+
+def setup_logging(quiet: bool = False) -> QueueListener:
+    """Hand every log record to a QueueListener thread so handler I/O stays off the event loop"""
+    global _log_listener
+    log_queue = queue.SimpleQueue()
+    diagnostics = logging.StreamHandler()
+    diagnostics.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    diagnostics.addFilter(lambda record: not record.name.startswith("enrich"))
+    status = logging.StreamHandler(sys.stdout)
+    status.setFormatter(logging.Formatter('%(message)s'))
+    status.addFilter(logging.Filter("enrich"))
+    
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Full format is applied by the listener
+    logging.basicConfig(level=logging.WARNING if quiet else logging.INFO, handlers=[queue_handler], force=True)
+    _log_listener = QueueListener(log_queue, diagnostics, status)
+    _log_listener.start()
+    return _log_listener
+
+
+def flush_log_output():
+    """Write out queued log records, e.g. before an interactive prompt"""
+    # Reason: stop() drains the queue and joins the thread; start() resumes
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener.start()
+
 from src.enrichment.complete_research_backend import CompleteResearchBackend
 from src.database.local_db import LocalDatabase
 
 
+def jdumps(obj) -> str:
+    """Serialize to a JSON string (orjson, decoded for TEXT columns)"""
+    return orjson.dumps(obj).decode()
+
+
+jloads = orjson.loads
+
+
+# Checkpoint progress after this many contacts or seconds, whichever comes first
+CHECKPOINT_EVERY = 50
+CHECKPOINT_SECS = 60
+
+# Print progress at most this often; completions arrive out of order
+PROGRESS_PRINT_SECS = 2.0
+
+# Burst past the worker count only once the oldest in-flight contact has
+# taken this long (a slow API tail)
+BURST_AFTER_SECS = 15.0
+
+# Backups younger than this are reused instead of taking a new one
+BACKUP_MAX_AGE_SECONDS = 3600
+
+
 class BudgetExceededError(Exception):
     """Raised when cost budget is exceeded"""
     pass
@@ -89,59 +161,109 @@ class CostTracker:
                 f"Avg/contact ${avg_per_contact:.3f}")
 
 
-class RateLimiter:
-    """Enhanced rate limiting with sliding window"""
-    def __init__(self, max_requests: int = 5, window_seconds: float = 1.0):
-        self.max_requests = max_requests
-        self.window = window_seconds
-        self.requests = deque()
-    
-    async def acquire(self):
-        """Wait if necessary to respect rate limit"""
-        now = time.time()
-        
-        # Remove old requests outside window
-        while self.requests and self.requests[0] < now - self.window:
-            self.requests.popleft()
-        
-        # If at limit, wait
-        if len(self.requests) >= self.max_requests:
-            sleep_time = self.window - (now - self.requests[0])
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-                # Recursive call to re-check
-                await self.acquire()
-        
-        # Add current request
-        self.requests.append(now)
-
-
 class HardenedCompleteCSVProcessor:
     """Hardened processor with cost control, retries, and safety features"""
     
-    def __init__(self, csv_path: str, batch_size: int = 25, budget_limit: float = 30.00):
+    # Reason: fixed attribute layout; the writer loop touches these per contact
+    __slots__ = (
+        "csv_path", "batch_size", "concurrency", "cost_tracker", "rate_limiter",
+        "http_client", "research_backend", "_research_person", "db", "db_path",
+        "pause_file", "_resume_event", "progress_ring",
+        "_last_checkpoint_count", "_last_checkpoint_time",
+        "processed", "failed", "total_contacts", "start_mono", "start_wall",
+        "_last_print", "_progress_tmpl", "last_successful_contact",
+        "_next_row", "_completed_rows", "_now", "_batch_id",
+        "_write_buf", "_flush_lock", "pool", "initial_db_count", "rows_written", "api_cache",
+        "column_mapping", "_csv_cols", "_db_cols", "_success_columns", "_failure_columns",
+        "_json_csv_indexes", "_success_sql", "_failure_sql", "_name_index",
+    )
+    
+    def __init__(self, csv_path: str, batch_size: int = 25, budget_limit: float = 30.00,
+                 concurrency: int = 8):
         self.csv_path = csv_path
         self.batch_size = batch_size
+        self.concurrency = concurrency
         self.cost_tracker = CostTracker(budget_limit=budget_limit)
-        self.rate_limiter = RateLimiter(max_requests=5, window_seconds=1.0)
+        self.rate_limiter = AsyncLimiter(max_rate=5, time_period=1.0)
+        
+        # One pooled HTTP/2 client (needs httpx[http2]) shared by every API
+        # call for the whole run, sized to the worker count so each worker
+        # keeps a warm connection (burst tasks may briefly use up to twice
+        # that). Only built when the backend's constructor accepts it
+        backend_kwargs = {}
+        backend_params = inspect.signature(CompleteResearchBackend).parameters.values()
+        if any(p.name == "http_client" or p.kind is p.VAR_KEYWORD for p in backend_params):
+            self.http_client: Optional[httpx.AsyncClient] = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=2 * concurrency,
+                    max_keepalive_connections=concurrency,
+                    keepalive_expiry=60
+                ),
+                timeout=httpx.Timeout(30, connect=5)
+            )
+            backend_kwargs["http_client"] = self.http_client
+        else:
+            self.http_client = None
+            logger.warning("⚠️  Research backend does not accept http_client; "
+                           "it will manage its own HTTP connections")
         
         # Wrap research backend with our enhanced version
         self.research_backend = CompleteResearchBackend(
             search_context_size="high",
             max_urls_to_extract=10,
-            include_fec_data=True
+            include_fec_data=True,
+            **backend_kwargs
+        )
+        # Prefer the backend's parallel entry point (Perplexity and FEC run
+        # concurrently; SERP/extraction chain after Perplexity) when it exists
+        self._research_person = getattr(
+            self.research_backend, "research_person_parallel", self.research_backend.research_person
         )
         self.db = LocalDatabase()
+        # Reason: the pool, backup and cache all open the file LocalDatabase
+        # manages, so a configured path is honoured everywhere
+        self.db_path = str(getattr(self.db, "db_path", "campaign_local.db"))
         
         # Pause control
         self.pause_file = Path("PAUSE")
-        self.progress_file = Path("processing_progress_hardened.json")
+        self._resume_event = asyncio.Event()  # Set while not paused
+        self.progress_ring = ProgressRing(Path("processing_progress_hardened.json"))
+        self._last_checkpoint_count = 0
+        self._last_checkpoint_time = time.monotonic()
         
         # Tracking
         self.processed = 0
         self.failed = 0
         self.total_contacts = 0
-        self.start_time = None
+        self.start_mono = 0.0  # time.monotonic() at start, for elapsed/ETA math
+        self.start_wall: Optional[datetime] = None  # Human-readable start time
+        self._last_print = 0.0  # time.monotonic() of the last progress update
+        self._progress_tmpl = (
+            "\n📊 Progress: {cur}/{tot} ({pct:.1f}%)\n"
+            "   ✅ Processed: {ok}, ❌ Failed: {bad}\n"
+            "   ⏱️  Elapsed: {el:.1f}m, Remaining: {rem:.1f}m\n"
+            "   {cost}"
+        )
+        self.last_successful_contact: Optional[Dict] = None
+        
+        # Contacts finish out of order; checkpoints only advance past rows
+        # whose results have all been written
+        self._next_row = 1  # 1-based CSV row number of the oldest unfinished contact
+        self._completed_rows: Set[int] = set()
+        
+        # Timestamp and batch id shared by every row in the current batch
+        self._now: Optional[str] = None
+        self._batch_id: Optional[str] = None
+        
+        # Write buffer drained by one executemany transaction per batch_size
+        # contacts: (sql, values)
+        self._write_buf: List[tuple] = []
+        self._flush_lock = asyncio.Lock()
+        self.pool: Optional[AsyncConnectionPool] = None
+        self.api_cache: Optional[ApiResponseCache] = None
+        self.initial_db_count = 0
+        self.rows_written = 0
         
         # CSV column mapping (same as original)
         self.column_mapping = {
@@ -211,78 +333,337 @@ class HardenedCompleteCSVProcessor:
             'City Council': 'city_council',
             'City Ward': 'city_ward'
         }
+        
+        # Precomputed column layouts (the schema is fixed for the whole run)
+        self._csv_cols = tuple(self.column_mapping.keys())
+        self._db_cols = tuple(self.column_mapping.values())
+        self._success_columns = self._db_cols + (
+            'perplexity_urls', 'linkedin_urls', 'all_urls', 'raw_research', 'research_confidence',
+            'research_status', 'researched_at', 'created_at', 'updated_at',
+            'batch_id', 'source', 'disambiguators', 'fec_summary',
+            'perplexity_confidence', 'overall_confidence', 'content_extracted'
+        )
+        self._failure_columns = self._db_cols + (
+            'research_status', 'research_notes', 'created_at', 'updated_at',
+            'batch_id', 'source'
+        )
+        # CSV columns stored in JSON-checked DB columns (untrusted input)
+        self._json_csv_indexes = tuple(
+            self._db_cols.index(col) for col in ('notes', 'tags', 'data_processing_consent_data')
+        )
+        # Constant INSERT statements, built once so SQLite's statement cache always hits
+        self._success_sql = (
+            f"INSERT INTO contacts ({', '.join(self._success_columns)}) "
+            f"VALUES ({', '.join('?' * len(self._success_columns))})"
+        )
+        self._failure_sql = (
+            f"INSERT INTO contacts ({', '.join(self._failure_columns)}) "
+            f"VALUES ({', '.join('?' * len(self._failure_columns))})"
+        )
+        self._name_index = self._db_cols.index('full_name')
     
     def backup_database(self):
         """Create database backup before processing"""
-        backup_name = f"campaign_local_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+        db_file = Path(self.db_path)
+        
+        # Reuse a recent backup of this database instead of copying it again
+        backups = sorted(db_file.parent.glob(f"{db_file.stem}_backup_*.db"), key=os.path.getmtime)
+        if backups and time.time() - os.path.getmtime(backups[-1]) < BACKUP_MAX_AGE_SECONDS:
+            logger.info(f"✅ Recent database backup found, reusing {backups[-1]}")
+            return str(backups[-1])
+        
+        backup_name = str(db_file.with_name(f"{db_file.stem}_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"))
         try:
-            shutil.copy2("campaign_local.db", backup_name)
+            # Online backup API: consistent with WAL and copies in page chunks.
+            # Read-only so a missing database raises instead of being created empty
+            src = sqlite3.connect(f"{db_file.resolve().as_uri()}?mode=ro", uri=True)
+            try:
+                dst = sqlite3.connect(backup_name)
+                try:
+                    src.backup(dst, pages=1000, sleep=0)  # Default sleeps 250ms between steps
+                finally:
+                    dst.close()
+            finally:
+                src.close()
             logger.info(f"✅ Database backed up to {backup_name}")
             return backup_name
         except Exception as e:
             logger.error(f"❌ Failed to backup database: {e}")
             raise
     
-    def save_progress(self):
+    async def aclose(self):
+        """Release pooled network and database connections"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+    
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a pooled connection with the run's pragmas applied once"""
+        # Autocommit mode: batch transactions are opened/closed explicitly
+        conn = await aiosqlite.connect(self.db_path, isolation_level=None)
+        try:
+            await conn.execute("PRAGMA journal_mode=WAL")
+            await conn.execute("PRAGMA synchronous=NORMAL")
+            await conn.execute("PRAGMA temp_store=MEMORY")
+            await conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        except BaseException:
+            # Reason: every connection owns a non-daemon thread; an unclosed one
+            # (e.g. cancelled mid-setup) keeps the interpreter from exiting
+            await asyncio.shield(conn.close())
+            raise
+        return conn
+    
+    async def configure_database(self):
+        """Open the async connection pool used for every database access"""
+        self.pool = AsyncConnectionPool(self._connect, min_size=2, max_size=self.concurrency)
+        await self.pool.open()
+        self.api_cache = ApiResponseCache(self.pool)
+        
+        # Count existing rows once up front; the final total is tracked in Python
+        async with self.pool.connection() as conn:
+            await ApiResponseCache.create_table(conn)
+            cursor = await conn.execute("SELECT COUNT(*) FROM contacts")
+            self.initial_db_count = (await cursor.fetchone())[0]
+    
+    async def flush_inserts(self):
+        """Write all pending contact rows without blocking the event loop"""
+        # Reason: the lock keeps flushes ordered, so a checkpoint that follows
+        # a flush never overtakes rows still being written by an earlier one
+        async with self._flush_lock:
+            if not self._write_buf:
+                return
+            pending, self._write_buf = self._write_buf, []
+            async with self.pool.connection() as conn:
+                await self._insert_rows(conn, pending)
+    
+    async def _insert_rows(self, conn: aiosqlite.Connection, pending: List[tuple]):
+        """Insert (sql, values) rows in a single transaction"""
+        # Success and failure rows use different statements
+        groups: Dict[str, List[List]] = {}
+        for sql, values in pending:
+            groups.setdefault(sql, []).append(values)
+        
+        try:
+            await conn.execute("BEGIN")
+            for sql, rows in groups.items():
+                await conn.executemany(sql, rows)
+            await conn.execute("COMMIT")
+            self.rows_written += len(pending)
+            return
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                await conn.execute("ROLLBACK")
+            logger.error(f"❌ Batch insert of {len(pending)} rows failed ({e}); retrying row by row")
+        
+        # Isolate the offending row(s) so the rest of the batch is kept
+        for sql, values in pending:
+            try:
+                await conn.execute(sql, values)
+                self.rows_written += 1
+            except sqlite3.Error as e:
+                logger.error(f"Failed to insert row {values[self._name_index]}: {e}")
+                if "malformed JSON" in str(e):
+                    # Log a few sample values to help debug
+                    for col, val in zip(self._db_cols[:10], values[:10]):  # First 10 fields only
+                        if val and isinstance(val, str) and len(val) > 10:
+                            logger.error(f"Sample field {col}: {repr(str(val)[:100])}")
+    
+    async def load_processed_ids(self) -> Set[str]:
+        """Contact IDs already enriched successfully, fetched in one query"""
+        async with self.pool.connection() as conn:
+            cursor = await conn.execute(
+                "SELECT original_contact_id FROM contacts "
+                "WHERE research_status = 'completed' AND original_contact_id != ''"
+            )
+            return {row[0] for row in await cursor.fetchall()}
+    
+    async def save_progress(self):
         """Save progress with enhanced tracking"""
+        # Reason: progress must never point past rows that are not on disk yet.
+        # Snapshot first, then flush: the writer keeps running during the
+        # flush, so anything read afterwards could count unwritten rows
         progress = {
-            "current_index": self.processed + self.failed,
+            "sequence": self.progress_ring.sequence,
+            "current_index": self._next_row - 1,  # Every CSV row before this is done
             "processed": self.processed,
             "failed": self.failed,
-            "last_successful_contact": getattr(self, 'last_successful_contact', None),
-            "cost_summary": self.cost_tracker.costs,
+            "last_successful_contact": self.last_successful_contact,
+            "cost_summary": dict(self.cost_tracker.costs),  # Snapshot; workers keep mutating it
             "total_cost": self.cost_tracker.get_total(),
             "timestamp": datetime.now().isoformat()
         }
-        with open(self.progress_file, 'w') as f:
-            json.dump(progress, f, indent=2)
+        _, slot_path = self.progress_ring.claim()
+        self._last_checkpoint_count = self.processed + self.failed
+        self._last_checkpoint_time = time.monotonic()
+        await self.flush_inserts()
+        # Serialization and disk I/O both run off the event loop
+        await asyncio.to_thread(self.progress_ring.write, slot_path, progress)
+    
+    def _stamp_batch(self):
+        """Refresh the timestamp and batch id shared by the next batch of rows"""
+        batch_time = datetime.now()
+        self._now = batch_time.isoformat()
+        self._batch_id = f"csv_hardened_{batch_time:%Y%m%d}"
+    
+    def _mark_row_done(self, row_number: int):
+        """Advance the resume watermark over every contiguous finished row"""
+        self._completed_rows.add(row_number)
+        while self._next_row in self._completed_rows:
+            self._completed_rows.remove(self._next_row)
+            self._next_row += 1
+    
+    async def write_results(self, results: asyncio.Queue):
+        """DB writer stage: batch result rows, count outcomes and checkpoint"""
+        # Hoist loop-invariant lookups; counters stay on self because
+        # checkpoints read them. _write_buf is swapped by flush_inserts,
+        # so it is deliberately not aliased
+        next_result = results.get
+        mark_row_done = self._mark_row_done
+        monotonic = time.monotonic
+        start = self.start_mono
+        total = self.total_contacts
+        tracker = self.cost_tracker
+        batch_size = self.batch_size
+        progress_tmpl = self._progress_tmpl
+        try:
+            while (result := await next_result()) is not None:
+                row_number, success, row = result
+                if row is not None:
+                    self._write_buf.append(row)
+                if success:
+                    self.processed += 1
+                else:
+                    self.failed += 1
+                
+                mark_row_done(row_number)
+                
+                # Time-throttled progress update (nothing is computed otherwise)
+                now = monotonic()
+                if now - self._last_print >= PROGRESS_PRINT_SECS:
+                    self._last_print = now
+                    processed, failed = self.processed, self.failed
+                    current_total = processed + failed
+                    elapsed = (now - start) / 60.0
+                    progress = current_total / total * 100
+                    remaining = (total - current_total) * (elapsed / current_total)
+                    # One record per update so the block is never interleaved
+                    progress_log.info(progress_tmpl.format_map({
+                        "cur": current_total, "tot": total, "pct": progress,
+                        "ok": processed, "bad": failed,
+                        "el": elapsed, "rem": remaining, "cost": tracker.get_summary(),
+                    }))
+                
+                if len(self._write_buf) >= batch_size:
+                    await self.flush_inserts()
+                    self._stamp_batch()
+                
+                if self.checkpoint_due():
+                    await self.save_progress()
+        finally:
+            # Drain the buffer even when the pipeline is cancelled
+            await self.flush_inserts()
+    
+    def checkpoint_due(self) -> bool:
+        """Whether enough contacts or time have passed since the last checkpoint"""
+        return (self.processed + self.failed - self._last_checkpoint_count >= CHECKPOINT_EVERY
+                or time.monotonic() - self._last_checkpoint_time >= CHECKPOINT_SECS)
     
     def load_progress(self) -> Optional[Dict]:
-        """Load saved progress"""
-        if self.progress_file.exists():
-            with open(self.progress_file, 'r') as f:
-                return json.load(f)
-        return None
-    
-    async def check_pause(self, current_index: int):
-        """Check for pause request"""
-        if self.pause_file.exists():
-            self.save_progress()
-            print("\n⏸️  PAUSE detected! Saving progress...")
-            print(f"   Processed: {self.processed}, Failed: {self.failed}")
-            print(f"   {self.cost_tracker.get_summary()}")
-            print("   Delete PAUSE file to resume.")
-            
-            while self.pause_file.exists():
-                await asyncio.sleep(5)
-            
-            print("▶️  Resuming processing...")
+        """Load the newest readable progress snapshot"""
+        return self.progress_ring.load()
     
-    def load_csv_contacts(self, skip_rows: int = 0, limit: Optional[int] = None) -> List[Dict]:
-        """Load contacts from CSV with mapping"""
-        contacts = []
+    async def watch_pause_file(self):
+        """Track PAUSE file creation/deletion with a single filesystem watch"""
+        pause_name = self.pause_file.name
+        
+        def is_pause_file(change, path: str) -> bool:
+            return Path(path).name == pause_name
         
+        async for _ in awatch(self.pause_file.parent, watch_filter=is_pause_file, recursive=False):
+            if self.pause_file.exists():
+                if self._resume_event.is_set():
+                    self._resume_event.clear()
+                    await self.check_pause()
+            elif not self._resume_event.is_set():
+                self._resume_event.set()
+                progress_log.info("▶️  Resuming processing...")
+    
+    async def check_pause(self):
+        """Announce a pause request and checkpoint while workers are held"""
+        # Reason: runs from the watcher, not the feeder, because the feeder is
+        # usually blocked on a full queue once the workers stop taking contacts
+        progress_log.info("\n⏸️  PAUSE detected! Saving progress...")
+        await self.save_progress()
+        progress_log.info(f"   Processed: {self.processed}, Failed: {self.failed}")
+        progress_log.info(f"   {self.cost_tracker.get_summary()}")
+        progress_log.info("   Delete PAUSE file to resume.")
+    
+    def count_csv_contacts(self, skip_rows: int = 0, limit: Optional[int] = None,
+                           skip_ids: Set[str] = frozenset()) -> int:
+        """Count CSV data rows still to process in one pass without building row dicts"""
+        # Reason: a raw newline count would over-count quoted multi-line notes,
+        # so rows are tokenised by csv.reader but never mapped or stored
+        with open(self.csv_path, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            id_index = header.index('Contact ID') if 'Contact ID' in header else None
+            stop = max(skip_rows + limit, skip_rows) if limit else None
+            rows = islice((row for row in reader if row), skip_rows, stop)  # DictReader skips blank rows too
+            if id_index is None or not skip_ids:
+                return sum(1 for _ in rows)
+            return sum(1 for row in rows if id_index >= len(row) or row[id_index] not in skip_ids)
+    
+    def iter_csv_contacts(self, skip_rows: int = 0, limit: Optional[int] = None) -> Iterator[Dict]:
+        """Stream contacts from CSV with mapping, one row at a time"""
         with open(self.csv_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             
-            # Skip rows if resuming
-            for _ in range(skip_rows):
-                next(reader, None)
+            # Skip rows if resuming and stop after the limit
+            stop = max(skip_rows + limit, skip_rows) if limit else None
+            rows = islice(reader, skip_rows, stop)
             
             # Read contacts
-            for i, row in enumerate(reader):
-                if limit and i >= limit:
-                    break
-                
+            for row_number, row in enumerate(rows, start=skip_rows + 1):
                 # Map CSV columns to database columns
-                contact = {}
-                for csv_col, db_col in self.column_mapping.items():
-                    contact[db_col] = row.get(csv_col, '')
-                
-                contact['row_number'] = skip_rows + i + 1
-                contacts.append(contact)
-        
-        return contacts
+                contact = dict(zip(self._db_cols, [row.get(csv_col, '') for csv_col in self._csv_cols]))
+                contact['row_number'] = row_number
+                yield contact
+    
+    @staticmethod
+    def coerce_db_value(value):
+        """Convert a non-string Python value into something SQLite can store"""
+        if isinstance(value, list):
+            return jdumps(value) if value else "[]"
+        if isinstance(value, (dict, tuple, set)):
+            return jdumps(value) if value else "{}"
+        if not isinstance(value, (str, int, float, bool, type(None))):
+            return str(value)
+        return value or ''
+    
+    def contact_values(self, contact: Dict) -> List:
+        """Column values for the CSV part of a contact row"""
+        # CSV rows only ever hold strings; other types go through coerce_db_value.
+        # No length cap here: SQLite TEXT is unbounded and the only long field
+        # (raw_research) is truncated where it is built
+        return [
+            value if value.__class__ is str else self.coerce_db_value(value)
+            for value in map(contact.get, self._db_cols)
+        ]
+    
+    def sanitize_json_csv_fields(self, values: List):
+        """Escape raw CSV values in JSON-checked columns that are not valid JSON"""
+        for i in self._json_csv_indexes:
+            val = values[i]
+            if not val:
+                continue
+            try:
+                jloads(val)
+            except (orjson.JSONDecodeError, TypeError) as e:
+                logger.warning(f"⚠️  {self._db_cols[i]}: Invalid JSON in CSV data: {e}")
+                # Escape the content as a JSON string: preserves the data but makes it SQLite-safe
+                values[i] = jdumps(val)
     
     @retry(
         stop=stop_after_attempt(3),
@@ -291,35 +672,51 @@ class HardenedCompleteCSVProcessor:
     )
     async def process_contact_with_retry(self, contact: Dict) -> Dict:
         """Process contact with retry logic"""
-        # Apply rate limiting
-        await self.rate_limiter.acquire()
-        
-        # Track cost before processing
-        try:
-            self.cost_tracker.add_contact()
-        except BudgetExceededError as e:
-            logger.error(f"🛑 {e}")
-            raise
+        research_args = {
+            "name": contact['full_name'],
+            "address": contact.get('street_address_1'),
+            "city": contact.get('city'),
+            "state": contact.get('province_state_region'),
+            "email": contact.get('email') if '@' in contact.get('email', '') else None,
+            "phone": contact.get('primary_phone_number')
+        }
         
-        # Call the actual research backend
-        name = contact['full_name']
-        research_data = await self.research_backend.research_person(
-            name=name,
-            address=contact.get('street_address_1'),
-            city=contact.get('city'),
-            state=contact.get('province_state_region'),
-            email=contact.get('email') if '@' in contact.get('email', '') else None,
-            phone=contact.get('primary_phone_number')
-        )
+        async def research() -> Dict:
+            # Apply rate limiting (leaky bucket shared by all coroutines)
+            async with self.rate_limiter:
+                # Track cost before processing
+                try:
+                    self.cost_tracker.add_contact()
+                except BudgetExceededError as e:
+                    logger.error(f"🛑 {e}")
+                    raise
+                
+                # Call the actual research backend
+                return await self._research_person(**research_args)
         
-        return research_data
+        # Serve repeat contacts from the cache (no API call, no cost).
+        # Keys are normalized so case/whitespace differences still hit
+        identity = [(research_args[k] or '').strip().lower()
+                    for k in ("name", "address", "city", "state", "email", "phone")]
+        cache_key = hashlib.sha1(orjson.dumps(identity)).hexdigest()
+        return await self.api_cache.call("research_person", cache_key, research)
     
-    async def process_contact(self, contact: Dict) -> bool:
-        """Process a single contact with complete enrichment pipeline"""
+    async def process_contact(self, contact: Dict) -> Tuple[bool, Optional[tuple]]:
+        """Process a single contact with complete enrichment pipeline
+        
+        Returns the outcome and the (sql, values) row to write, if any.
+        """
         name = contact['full_name']
         if not name or name.strip() == '':
             logger.warning(f"Skipping contact with no name (row {contact['row_number']})")
-            return False
+            return False, None
+        
+        # Shared CSV prefix for both the success and the failure row.
+        # Raw CSV values are untrusted; the enrichment fields added below come
+        # straight from jdumps and are valid by construction
+        values = self.contact_values(contact)
+        self.sanitize_json_csv_fields(values)
+        csv_width = len(values)
         
         try:
             # Process with retry logic
@@ -335,85 +732,38 @@ class HardenedCompleteCSVProcessor:
             # Extract research results (same as original)
             urls = research_data.get('urls', [])
             linkedin_urls = research_data.get('linkedin_urls', [])
-            urls_json = json.dumps(urls) if urls else None
-            linkedin_urls_json = json.dumps(linkedin_urls) if linkedin_urls else None
+            urls_json = jdumps(urls) if urls else None
+            linkedin_urls_json = jdumps(linkedin_urls) if linkedin_urls else None
             research_text = research_data.get('research_text', '')
             confidence = research_data.get('confidence', 'Medium')
             disambiguators = research_data.get('disambiguators', {})
             fec_data = research_data.get('fec_data', {})
             
             # Store disambiguators as JSON
-            disambiguators_json = json.dumps(disambiguators) if disambiguators else None
+            disambiguators_json = jdumps(disambiguators) if disambiguators else None
             
             # Store FEC summary
             fec_summary = None
             if fec_data and fec_data.get('total_contributions', 0) > 0:
-                fec_summary = json.dumps({
+                fec_summary = jdumps({
                     'total_amount': fec_data.get('total_amount', 0),
                     'contribution_count': fec_data.get('contribution_count', 0),
                     'party_leaning': fec_data.get('primary_party', 'Unknown'),
                     'years_active': fec_data.get('years_active', [])
                 })
             
-            # Prepare ALL data for insertion
-            now = datetime.now().isoformat()
-            
-            # Build column names and values for ALL CSV columns plus enrichment
-            columns = list(self.column_mapping.values()) + [
-                'perplexity_urls', 'linkedin_urls', 'all_urls', 'raw_research', 'research_confidence',
-                'research_status', 'researched_at', 'created_at', 'updated_at',
-                'batch_id', 'source', 'disambiguators', 'fec_summary', 
-                'perplexity_confidence', 'overall_confidence', 'content_extracted'
-            ]
-            
-            values = []
-            # Add all CSV column values with proper JSON handling
-            for db_col in self.column_mapping.values():
-                value = contact.get(db_col, '')
-                # Apply same JSON handling as in database insert
-                if value is not None:
-                    if isinstance(value, (dict, list, tuple, set)):
-                        if isinstance(value, list):
-                            value = json.dumps(value) if value else "[]"
-                        else:
-                            value = json.dumps(value) if value else "{}"
-                    elif isinstance(value, str) and len(value) > 50000:
-                        value = value[:50000] + "... [truncated]"
-                    elif not isinstance(value, (str, int, float, bool, type(None))):
-                        value = str(value)
-                values.append(value or '')
-            
-            # Validate all JSON fields before database insert
-            def validate_json_field(json_str, field_name, default_value="{}"):
-                """Validate JSON string and return safe default if invalid."""
-                if json_str is None:
-                    return None
-                try:
-                    # Test if JSON is valid by parsing it
-                    json.loads(str(json_str))
-                    return json_str
-                except (json.JSONDecodeError, TypeError) as e:
-                    logger.warning(f"Invalid JSON in {field_name}: {e}. Using default: {default_value}")
-                    return default_value
-            
-            # Validate JSON fields
-            urls_json = validate_json_field(urls_json, "urls_json", "[]")
-            linkedin_urls_json = validate_json_field(linkedin_urls_json, "linkedin_urls_json", "[]")
-            disambiguators_json = validate_json_field(disambiguators_json, "disambiguators_json", "{}")
-            fec_summary = validate_json_field(fec_summary, "fec_summary", "{}")
-            
             # Add enrichment values
             values.extend([
                 urls_json,                # perplexity_urls
                 linkedin_urls_json,       # linkedin_urls
-                urls_json,                # all_urls (use same validated JSON)
+                urls_json,                # all_urls (same JSON as perplexity_urls)
                 research_text[:10000] if research_text else None,  # raw_research
                 confidence,               # research_confidence
                 'completed',              # research_status
-                now,                      # researched_at
-                now,                      # created_at
-                now,                      # updated_at
-                f"csv_hardened_{datetime.now().strftime('%Y%m%d')}",  # batch_id
+                self._now,                # researched_at
+                self._now,                # created_at
+                self._now,                # updated_at
+                self._batch_id,           # batch_id
                 'csv_import_hardened',    # source
                 disambiguators_json,      # disambiguators
                 fec_summary,              # fec_summary
@@ -422,99 +772,16 @@ class HardenedCompleteCSVProcessor:
                 len(research_data.get('extracted_content', []))  # content_extracted
             ])
             
-            # Final validation of ALL JSON values before insert
-            logger.info(f"📝 Final validation before database insert for {name}")
-            for i, (col, val) in enumerate(zip(columns, values)):
-                if val and isinstance(val, str) and (col.endswith('_json') or col in ['disambiguators', 'fec_summary', 'perplexity_urls', 'linkedin_urls', 'all_urls']):
-                    logger.info(f"🔍 Checking {col}: {str(val)[:100]}...")
-                    try:
-                        json.loads(val)
-                        logger.info(f"✅ {col}: Valid JSON")
-                    except (json.JSONDecodeError, TypeError) as e:
-                        logger.warning(f"⚠️  {col}: Invalid JSON detected: {e}")
-                        logger.warning(f"⚠️  Original value: {str(val)[:200]}...")
-                        # Replace with safe default
-                        if col.endswith('_json') or col in ['perplexity_urls', 'linkedin_urls', 'all_urls']:
-                            values[i] = "[]"
-                        else:
-                            values[i] = "{}"
-                        logger.warning(f"🔧 {col}: Replaced with safe default")
-                
-            # COMPREHENSIVE JSON validation for ALL fields that might contain JSON
-            # This checks both generated fields AND CSV fields that contain JSON-like data
-            potential_json_fields = ['notes', 'tags', 'data_processing_consent_data'] # Common CSV JSON fields
-            
-            for i, (col, val) in enumerate(zip(columns, values)):
-                if val and isinstance(val, str):
-                    # Check if field might contain JSON (starts with [ or { OR is a known JSON field)
-                    is_json_like = (len(val) > 1 and (val.strip().startswith('[') or val.strip().startswith('{')))
-                    is_known_json_field = col.lower() in potential_json_fields
-                    
-                    if is_json_like or is_known_json_field:
-                        logger.info(f"🔍 Comprehensive check {col}: {str(val)[:100]}...")
-                        try:
-                            json.loads(val)
-                            logger.info(f"✅ {col}: Valid JSON")
-                        except (json.JSONDecodeError, TypeError) as e:
-                            logger.warning(f"⚠️  {col}: Invalid JSON in CSV data: {e}")
-                            logger.warning(f"⚠️  Original value: {str(val)[:200]}...")
-                            # For CSV fields, escape the entire content as a JSON string
-                            # This preserves the data but makes it SQLite-safe
-                            values[i] = json.dumps(val)  # Escape the malformed JSON as a string
-                            logger.warning(f"🔧 {col}: Escaped as JSON string")
-                            
-                    # Additional safety: Check for any string that contains unescaped quotes or backslashes
-                    elif isinstance(val, str) and ('\\' in val or val.count('"') % 2 != 0):
-                        logger.info(f"🔍 Quote/escape check {col}: {str(val)[:50]}...")
-                        # Test if the string would be problematic as-is
-                        try:
-                            # Try to use it in a JSON context to see if it causes issues
-                            test_json = json.dumps({"test": val})
-                            json.loads(test_json)  # Validate the resulting JSON
-                            logger.debug(f"✅ {col}: Safe for JSON context")
-                        except (json.JSONDecodeError, TypeError) as e:
-                            logger.warning(f"⚠️  {col}: Problematic string for JSON context: {e}")
-                            # Clean up the string by escaping it properly
-                            values[i] = json.dumps(val)[1:-1]  # Remove outer quotes, keep inner escaping
-                            logger.warning(f"🔧 {col}: Cleaned string escaping")
-            
-            # Insert into database with ALL columns
-            placeholders = ', '.join(['?' for _ in values])
-            column_names = ', '.join(columns)
+            # Log enrichment phases (debug only; one summary line per contact)
+            if logger.isEnabledFor(logging.DEBUG):
+                phases = research_data.get('search_phases', {})
+                logger.debug(f"   Phase 1 (Perplexity): {disambiguators.get('employer', 'N/A')} - {disambiguators.get('job_title', 'N/A')}")
+                logger.debug(f"   Phase 2 (SERP): Found {len(urls)} URLs, {len(linkedin_urls)} LinkedIn")
+                logger.debug(f"   Phase 3 (Content): Extracted from {phases.get('phase3_extraction', {}).get('urls_processed', 0)} URLs")
+                logger.debug(f"   Phase 4 (FEC): {phases.get('phase4_fec', {}).get('contributions_found', 0)} contributions")
+            logger.info(f"✅ {name}: {len(urls)} URLs, confidence={confidence}")
             
-            # Debug: Log the exact INSERT statement
-            logger.info(f"🎯 Attempting INSERT with {len(columns)} columns, {len(values)} values")
-            logger.info(f"🎯 Column count check: {len(columns) == len(values)}")
-            
-            try:
-                with self.db.get_connection() as conn:
-                    cursor = conn.execute(f'''
-                        INSERT INTO contacts ({column_names})
-                        VALUES ({placeholders})
-                    ''', values)
-                    conn.commit()
-            except sqlite3.OperationalError as e:
-                if "malformed JSON" in str(e):
-                    logger.error(f"🔍 SQLite JSON Error - this should not happen with comprehensive validation!")
-                    logger.error(f"🔍 If you see this, there's still a JSON field we missed")
-                    # Log a few sample values to help debug
-                    for i, (col, val) in enumerate(zip(columns[:10], values[:10])):  # First 10 fields only
-                        if val and isinstance(val, str) and len(val) > 10:
-                            logger.error(f"Sample field {col}: {repr(str(val)[:100])}")
-                    raise  # Re-raise the original error
-                else:
-                    raise  # Re-raise if it's not a JSON error
-            
-            # Log enrichment phases
-            phases = research_data.get('search_phases', {})
-            logger.info(f"✅ {name}: Complete enrichment")
-            logger.info(f"   Phase 1 (Perplexity): {disambiguators.get('employer', 'N/A')} - {disambiguators.get('job_title', 'N/A')}")
-            logger.info(f"   Phase 2 (SERP): Found {len(urls)} URLs, {len(linkedin_urls)} LinkedIn")
-            logger.info(f"   Phase 3 (Content): Extracted from {phases.get('phase3_extraction', {}).get('urls_processed', 0)} URLs")
-            logger.info(f"   Phase 4 (FEC): {phases.get('phase4_fec', {}).get('contributions_found', 0)} contributions")
-            logger.info(f"   Overall confidence: {confidence}")
-            
-            return True
+            return True, (self._success_sql, values)
             
         except BudgetExceededError:
             # Re-raise budget errors to stop processing
@@ -527,96 +794,61 @@ class HardenedCompleteCSVProcessor:
             logger.error(f"Traceback: {traceback.format_exc()}")
             
             # Even for failures, preserve original data
-            try:
-                now = datetime.now().isoformat()
-                columns = list(self.column_mapping.values()) + [
-                    'research_status', 'research_notes', 'created_at', 'updated_at',
-                    'batch_id', 'source'
-                ]
-                
-                values = []
-                for db_col in self.column_mapping.values():
-                    value = contact.get(db_col, '')
-                    # Apply same JSON handling as in database insert
-                    if value is not None:
-                        if isinstance(value, (dict, list, tuple, set)):
-                            if isinstance(value, list):
-                                value = json.dumps(value) if value else "[]"
-                            else:
-                                value = json.dumps(value) if value else "{}"
-                        elif isinstance(value, str) and len(value) > 50000:
-                            value = value[:50000] + "... [truncated]"
-                        elif not isinstance(value, (str, int, float, bool, type(None))):
-                            value = str(value)
-                    values.append(value or '')
-                
-                values.extend([
-                    'failed',
-                    str(e)[:500],
-                    now,
-                    now,
-                    f"csv_hardened_{datetime.now().strftime('%Y%m%d')}",
-                    'csv_import_hardened'
-                ])
-                
-                # Validate JSON in error record too
-                for i, (col, val) in enumerate(zip(columns, values)):
-                    if val and isinstance(val, str) and (col.endswith('_json') or col in ['disambiguators', 'fec_summary', 'perplexity_urls', 'linkedin_urls', 'all_urls']):
-                        try:
-                            json.loads(val)
-                        except (json.JSONDecodeError, TypeError):
-                            values[i] = "[]" if col.endswith('_json') or col in ['perplexity_urls', 'linkedin_urls', 'all_urls'] else "{}"
-                
-                placeholders = ', '.join(['?' for _ in values])
-                column_names = ', '.join(columns)
-                
-                with self.db.get_connection() as conn:
-                    cursor = conn.execute(f'''
-                        INSERT INTO contacts ({column_names})
-                        VALUES ({placeholders})
-                    ''', values)
-                    conn.commit()
-                    
-            except Exception as db_error:
-                logger.error(f"Failed to record error for {name}: {db_error}")
+            # (dropping any enrichment values appended before the failure)
+            del values[csv_width:]
+            values.extend([
+                'failed',
+                str(e)[:500],
+                self._now,
+                self._now,
+                self._batch_id,
+                'csv_import_hardened'
+            ])
             
-            return False
+            return False, (self._failure_sql, values)
     
     async def process_csv(self, start_row: int = 0, end_row: Optional[int] = None):
         """Process CSV with complete enrichment pipeline and hardening"""
-        self.start_time = datetime.now()
-        
-        print("🚀 HARDENED COMPLETE ENRICHMENT PIPELINE")
-        print("=" * 60)
-        print("📋 Pipeline phases:")
-        print("   1. Perplexity disambiguation (employer, title, education)")
-        print("   2. Bright Data SERP (find all URLs)")
-        print("   3. Content extraction (blogs, news, company pages)")
-        print("   4. FEC political contributions")
-        print("   5. LinkedIn URLs collected for later processing")
-        print("=" * 60)
-        print("🛡️  HARDENING FEATURES:")
-        print(f"   💰 Cost tracking with ${self.cost_tracker.budget_limit:.2f} budget limit")
-        print("   🔄 Retry logic for API failures (3 attempts)")
-        print("   ⏱️  Enhanced rate limiting (5 req/sec)")
-        print("   💾 Database backup before processing")
-        print("   📊 Enhanced progress tracking")
-        print("=" * 60)
-        print("⏸️  TO PAUSE: Create a file named 'PAUSE' in this directory")
-        print("▶️  TO RESUME: Delete the PAUSE file")
-        print("=" * 60)
+        self.start_mono = time.monotonic()
+        self.start_wall = datetime.now()
+        
+        progress_log.info("🚀 HARDENED COMPLETE ENRICHMENT PIPELINE")
+        progress_log.info("=" * 60)
+        progress_log.info("📋 Pipeline phases:")
+        progress_log.info("   1. Perplexity disambiguation (employer, title, education)")
+        progress_log.info("   2. Bright Data SERP (find all URLs)")
+        progress_log.info("   3. Content extraction (blogs, news, company pages)")
+        progress_log.info("   4. FEC political contributions")
+        progress_log.info("   5. LinkedIn URLs collected for later processing")
+        progress_log.info("=" * 60)
+        progress_log.info("🛡️  HARDENING FEATURES:")
+        progress_log.info(f"   💰 Cost tracking with ${self.cost_tracker.budget_limit:.2f} budget limit")
+        progress_log.info("   🔄 Retry logic for API failures (3 attempts)")
+        progress_log.info("   ⏱️  Enhanced rate limiting (5 req/sec)")
+        progress_log.info(f"   ⚡ Concurrent processing ({self.concurrency} workers)")
+        progress_log.info("   💾 Database backup before processing")
+        progress_log.info("   📊 Enhanced progress tracking")
+        progress_log.info("=" * 60)
+        progress_log.info("⏸️  TO PAUSE: Create a file named 'PAUSE' in this directory")
+        progress_log.info("▶️  TO RESUME: Delete the PAUSE file")
+        progress_log.info("=" * 60)
         
         # Create database backup
         try:
-            backup_file = self.backup_database()
+            # Page copying runs in a worker thread so the loop stays responsive
+            backup_file = await asyncio.to_thread(self.backup_database)
         except Exception as e:
+            flush_log_output()
             print(f"❌ Failed to create backup: {e}")
             if input("Continue without backup? (y/n): ").lower() != 'y':
                 return
         
+        await self.configure_database()
+        
         # Check for saved progress
         saved_progress = self.load_progress()
         if saved_progress and start_row == 0:
+            flush_log_output()
             print(f"\n📂 Found saved progress from {saved_progress['timestamp']}")
             print(f"   Processed: {saved_progress['processed']}, Failed: {saved_progress['failed']}")
             print(f"   Total cost so far: ${saved_progress['total_cost']:.2f}")
@@ -627,90 +859,194 @@ class HardenedCompleteCSVProcessor:
                 start_row = saved_progress['current_index']
                 self.processed = saved_progress['processed']
                 self.failed = saved_progress['failed']
+                self._last_checkpoint_count = self.processed + self.failed
                 # Restore cost tracker
                 if 'cost_summary' in saved_progress:
                     self.cost_tracker.costs = saved_progress['cost_summary']
-                print(f"▶️  Resuming from contact {start_row + 1}")
+                progress_log.info(f"▶️  Resuming from contact {start_row + 1}")
         
         # Load contacts
+        # Contacts already enriched by an earlier run are skipped in memory
+        # instead of being looked up one row at a time
+        processed_ids = await self.load_processed_ids()
+        
+        # Count contacts up front; rows are streamed, never held in memory
         limit = (end_row - start_row) if end_row else None
-        contacts = self.load_csv_contacts(skip_rows=start_row, limit=limit)
-        self.total_contacts = len(contacts) + start_row
+        contact_count = self.count_csv_contacts(skip_rows=start_row, limit=limit, skip_ids=processed_ids)
+        self.total_contacts = contact_count + self.processed + self.failed
+        if processed_ids:
+            progress_log.info(f"⏭️  Skipping contacts already enriched ({len(processed_ids)} in database)")
         
-        if not contacts:
-            print("❌ No contacts to process")
+        if not contact_count:
+            progress_log.info("❌ No contacts to process")
             return
         
-        print(f"\n🔬 Starting processing of {len(contacts)} contacts...")
-        print(f"📊 Complete enrichment with all data sources")
-        print(f"⏱️  Estimated time: {len(contacts) * 3 / 60:.1f} minutes")
-        print(f"💰 Estimated cost: ${len(contacts) * 0.02:.2f}")
+        progress_log.info(f"\n🔬 Starting processing of {contact_count} contacts...")
+        progress_log.info(f"📊 Complete enrichment with all data sources")
+        progress_log.info(f"⏱️  Estimated time: {contact_count * 3 / 60:.1f} minutes")
+        progress_log.info(f"💰 Estimated cost: ${contact_count * 0.02:.2f}")
+        
+        contacts = self.iter_csv_contacts(skip_rows=start_row, limit=limit)
+        self._next_row = start_row + 1
+        self._stamp_batch()
+        
+        # Pause state is pushed by a file watcher instead of polled per contact
+        pause_watcher = asyncio.create_task(self.watch_pause_file())
+        if not self.pause_file.exists():
+            self._resume_event.set()
+        else:
+            await self.check_pause()
+        
+        # Three-stage pipeline: CSV reader -> N enrichment workers -> DB writer.
+        # Bounded queues apply backpressure so memory stays flat for any CSV size
+        todo: asyncio.Queue = asyncio.Queue(maxsize=2 * self.concurrency)
+        results: asyncio.Queue = asyncio.Queue(maxsize=2 * self.concurrency)
+        
+        # Start times of contacts being processed, oldest first (dict order)
+        started: Dict[int, float] = {}
+        
+        async def handle(contact: Dict):
+            # Workers hold up to 2N queued contacts; PAUSE must stop their API spend too
+            await self._resume_event.wait()
+            row_number = contact['row_number']
+            started[row_number] = time.monotonic()
+            try:
+                success, row = await self.process_contact(contact)
+            finally:
+                del started[row_number]
+            await results.put((row_number, success, row))
+        
+        def until_stalled() -> float:
+            """Seconds until the oldest in-flight contact counts as stalled"""
+            oldest = next(iter(started.values()), None)
+            if oldest is None:
+                return BURST_AFTER_SECS
+            return max(oldest + BURST_AFTER_SECS - time.monotonic(), 0.0)
+        
+        async def feed():
+            # While the queue is backed up behind a stalled contact, run up to
+            # `concurrency` extra one-shot tasks; each handles a single contact
+            # and is gone once it finishes, so steady state stays at N
+            burst: Set[asyncio.Task] = set()
+            burst_errors: List[BaseException] = []
+            
+            def burst_done(task: asyncio.Task):
+                burst.discard(task)
+                if not task.cancelled() and task.exception() is not None:
+                    burst_errors.append(task.exception())
+            
+            try:
+                for contact in contacts:
+                    if burst_errors:
+                        raise burst_errors[0]
+                    if contact['original_contact_id'] in processed_ids:
+                        self._mark_row_done(contact['row_number'])
+                        continue
+                    if not todo.full():
+                        todo.put_nowait(contact)
+                        continue
+                    # Queue is backed up: wait for space, but only until the
+                    # oldest contact stalls or, once bursts are maxed, until
+                    # one of the burst tasks finishes
+                    while True:
+                        room = len(burst) < self.concurrency
+                        put = asyncio.ensure_future(todo.put(contact))
+                        try:
+                            await asyncio.wait(
+                                {put} if room else {put, *burst},
+                                timeout=until_stalled() if room else None,
+                                return_when=asyncio.FIRST_COMPLETED,
+                            )
+                        finally:
+                            put.cancel()  # No-op once the contact is queued
+                        if put.done():
+                            break
+                        if room and until_stalled() == 0.0:
+                            task = asyncio.create_task(handle(contact))
+                            burst.add(task)
+                            task.add_done_callback(burst_done)
+                            break
+                for _ in range(self.concurrency):
+                    await todo.put(None)  # One stop signal per worker
+                await asyncio.gather(*burst)
+                if burst_errors:
+                    raise burst_errors[0]
+            finally:
+                for task in burst:
+                    task.cancel()
+                # Reason: a burst task still holding a pooled connection must give
+                # it back before the writer stops and the pool is closed
+                await asyncio.gather(*burst, return_exceptions=True)
+        
+        async def worker():
+            while (contact := await todo.get()) is not None:
+                await handle(contact)
+        
+        stages = [asyncio.create_task(feed())]
+        stages += [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        writer = asyncio.create_task(self.write_results(results))
+        
+        def stop_stages_on_writer_error(task: asyncio.Task):
+            # Reason: a dead writer would leave workers blocked on a full queue
+            if not task.cancelled() and task.exception() is not None:
+                for stage in stages:
+                    stage.cancel()
+        writer.add_done_callback(stop_stages_on_writer_error)
         
         try:
-            # Process contacts one by one
-            for i, contact in enumerate(contacts):
-                # Check for pause request
-                await self.check_pause(start_row + i)
-                
-                # Process the contact
-                success = await self.process_contact(contact)
-                if success:
-                    self.processed += 1
-                else:
-                    self.failed += 1
-                
-                # Progress update
-                current_total = self.processed + self.failed
-                progress = current_total / self.total_contacts * 100
-                elapsed = (datetime.now() - self.start_time).total_seconds() / 60
-                
-                # Update every 5 contacts
-                if current_total % 5 == 0:
-                    remaining = (self.total_contacts - current_total) * (elapsed / current_total)
-                    print(f"\n📊 Progress: {current_total}/{self.total_contacts} ({progress:.1f}%)")
-                    print(f"   ✅ Processed: {self.processed}, ❌ Failed: {self.failed}")
-                    print(f"   ⏱️  Elapsed: {elapsed:.1f}m, Remaining: {remaining:.1f}m")
-                    print(f"   {self.cost_tracker.get_summary()}")
-                    
-                    # Save progress periodically
-                    self.save_progress()
+            try:
+                await asyncio.gather(*stages)
+            finally:
+                # Budget errors surface from one worker; stop the others, then
+                # let the writer drain whatever results are already queued
+                for stage in stages:
+                    stage.cancel()
+                await asyncio.gather(*stages, return_exceptions=True)
+                if not writer.done():
+                    await results.put(None)
+                await writer
+            
+            # Final checkpoint for the tail of the run
+            await self.save_progress()
         
         except BudgetExceededError as e:
-            print(f"\n🛑 STOPPING: {e}")
-            print(f"   Processed {self.processed} contacts before hitting budget limit")
-            self.save_progress()
+            progress_log.warning(f"\n🛑 STOPPING: {e}")
+            progress_log.warning(f"   Processed {self.processed} contacts before hitting budget limit")
+            await self.save_progress()
         
-        except KeyboardInterrupt:
-            print("\n⚠️  Interrupted! Saving progress...")
-            self.save_progress()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Reason: asyncio.run turns Ctrl-C into a CancelledError in this task
+            progress_log.warning("\n⚠️  Interrupted! Saving progress...")
+            await self.save_progress()
             raise
         
         except Exception as e:
-            print(f"\n❌ Unexpected error: {e}")
-            self.save_progress()
+            progress_log.error(f"\n❌ Unexpected error: {e}")
+            await self.save_progress()
             raise
         
         finally:
+            contacts.close()
+            pause_watcher.cancel()
+            
             # Final summary
-            total_time = (datetime.now() - self.start_time).total_seconds() / 60
-            print("\n" + "=" * 60)
-            print("📊 FINAL SUMMARY")
-            print("=" * 60)
-            print(f"✅ Successfully processed: {self.processed}")
-            print(f"❌ Failed: {self.failed}")
-            print(f"⏱️  Total time: {total_time:.1f} minutes")
-            print(f"{self.cost_tracker.get_summary()}")
-            print(f"💾 Database backup: {backup_file if 'backup_file' in locals() else 'Not created'}")
+            total_time = (time.monotonic() - self.start_mono) / 60.0
+            summary_log.info("\n" + "=" * 60)
+            summary_log.info("📊 FINAL SUMMARY")
+            summary_log.info("=" * 60)
+            summary_log.info(f"✅ Successfully processed: {self.processed}")
+            summary_log.info(f"❌ Failed: {self.failed}")
+            summary_log.info(f"⏱️  Total time: {total_time:.1f} minutes (started {self.start_wall:%Y-%m-%d %H:%M:%S})")
+            summary_log.info(f"{self.cost_tracker.get_summary()}")
+            summary_log.info(f"💾 Database backup: {backup_file if 'backup_file' in locals() else 'Not created'}")
             
             # Check database state
-            with self.db.get_connection() as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM contacts")
-                total_in_db = cursor.fetchone()[0]
-                print(f"📊 Total contacts in database: {total_in_db}")
+            await self.flush_inserts()
+            summary_log.info(f"📊 Total contacts in database: {self.initial_db_count + self.rows_written}")
 
 
-async def main():
-    """Main entry point"""
+def cli():
+    """Parse arguments and validate the environment before starting the event loop"""
     import argparse
     
     parser = argparse.ArgumentParser(description='Process CSV with hardened complete enrichment pipeline')
@@ -718,8 +1054,12 @@ async def main():
     parser.add_argument('--start', type=int, default=0, help='Start row (0-based)')
     parser.add_argument('--end', type=int, help='End row (exclusive)')
     parser.add_argument('--budget', type=float, default=30.00, help='Budget limit in USD')
+    parser.add_argument('--concurrency', type=int, default=8, help='Contacts processed concurrently')
+    parser.add_argument('--quiet', action='store_true', help='Only show warnings, errors and the final summary')
     
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
     
     # Verify CSV exists
     if not os.path.exists(args.csv):
@@ -734,14 +1074,30 @@ async def main():
         print("   Please set them in your .env file")
         sys.exit(1)
     
+    listener = setup_logging(quiet=args.quiet)
+    try:
+        if uvloop is not None:
+            uvloop.run(main(args))
+        else:
+            asyncio.run(main(args))
+    finally:
+        listener.stop()
+
+
+async def main(args):
+    """Main entry point"""
     # Create processor and run
     processor = HardenedCompleteCSVProcessor(
         csv_path=args.csv,
-        budget_limit=args.budget
+        budget_limit=args.budget,
+        concurrency=args.concurrency
     )
     
-    await processor.process_csv(start_row=args.start, end_row=args.end)
+    try:
+        await processor.process_csv(start_row=args.start, end_row=args.end)
+    finally:
+        await processor.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    cli()
@@ -0,0 +1,77 @@
+"""
+Shared fixtures for the CSV enrichment pipeline tests
+"""
+
+import sqlite3
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def _install_backend_stand_ins():
+    """Register minimal research/database modules when the real ones are absent"""
+    # Reason: the processor imports these at module level, but the tests
+    # never call the research backend or LocalDatabase
+    try:
+        import src.enrichment.complete_research_backend  # noqa: F401
+        import src.database.local_db  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    class CompleteResearchBackend:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+        async def research_person(self, **kwargs):
+            raise AssertionError("research backend must not be called in unit tests")
+
+    class LocalDatabase:
+        def __init__(self, db_path="campaign_local.db"):
+            self.db_path = db_path
+
+    modules = {
+        "src": types.ModuleType("src"),
+        "src.enrichment": types.ModuleType("src.enrichment"),
+        "src.enrichment.complete_research_backend": types.ModuleType("src.enrichment.complete_research_backend"),
+        "src.database": types.ModuleType("src.database"),
+        "src.database.local_db": types.ModuleType("src.database.local_db"),
+    }
+    modules["src.enrichment.complete_research_backend"].CompleteResearchBackend = CompleteResearchBackend
+    modules["src.database.local_db"].LocalDatabase = LocalDatabase
+    sys.modules.update(modules)
+
+
+_install_backend_stand_ins()
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    """
+    Processor working in an empty directory with an empty contacts table.
+
+    Returns:
+        HardenedCompleteCSVProcessor: Unconfigured processor (no pool yet).
+    """
+    import process_full_csv_hardened as pipeline
+
+    monkeypatch.chdir(tmp_path)
+    csv_path = tmp_path / "contacts.csv"
+    csv_path.write_text("Contact ID,Full Name\n")
+    processor = pipeline.HardenedCompleteCSVProcessor(csv_path=str(csv_path), concurrency=2)
+    
+    # Every column the processor writes; notes carries a JSON check like the real schema
+    columns = dict.fromkeys(processor._success_columns + processor._failure_columns)
+    columns["notes"] = "CHECK (notes = '' OR json_valid(notes))"
+    conn = sqlite3.connect(tmp_path / "campaign_local.db")
+    conn.execute(
+        "CREATE TABLE contacts (id INTEGER PRIMARY KEY, "
+        + ", ".join(f"{name} TEXT {check or ''}" for name, check in columns.items()) + ")"
+    )
+    conn.close()
+    return processor
@@ -0,0 +1,130 @@
+"""
+Tests for the persistent API response cache
+"""
+
+import asyncio
+
+import aiosqlite
+
+from api_cache import ApiResponseCache
+from db_pool import AsyncConnectionPool
+
+
+def run_with_cache(db_path, scenario):
+    """Run scenario(cache) against an api_cache table in db_path"""
+    async def run():
+        pool = AsyncConnectionPool(lambda: aiosqlite.connect(db_path, isolation_level=None), min_size=1)
+        await pool.open()
+        try:
+            async with pool.connection() as conn:
+                await ApiResponseCache.create_table(conn)
+            return await scenario(ApiResponseCache(pool))
+        finally:
+            await pool.close()
+    return asyncio.run(run())
+
+
+def test_persisted_response_is_served_without_calling(tmp_path):
+    """A response stored by an earlier run is returned without calling fn"""
+    async def fetch():
+        return {"confidence": "High"}
+    
+    async def unexpected_fetch():
+        raise AssertionError("cached response should have been used")
+    
+    async def first_run(cache):
+        return await cache.call("research_person", "k1", fetch)
+    
+    async def second_run(cache):
+        return await cache.call("research_person", "k1", unexpected_fetch)
+    
+    run_with_cache(tmp_path / "cache.db", first_run)
+    
+    assert run_with_cache(tmp_path / "cache.db", second_run) == {"confidence": "High"}
+
+
+def test_providers_are_cached_separately(tmp_path):
+    """The same key under another provider is a cache miss"""
+    async def scenario(cache):
+        async def fetch_a():
+            return {"provider": "a"}
+        
+        async def fetch_b():
+            return {"provider": "b"}
+        
+        await cache.call("perplexity", "k1", fetch_a)
+        return await cache.call("bright_data", "k1", fetch_b)
+    
+    assert run_with_cache(tmp_path / "cache.db", scenario) == {"provider": "b"}
+
+
+def test_concurrent_calls_share_one_request(tmp_path):
+    """Concurrent callers for one key share a single upstream call"""
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"urls": ["https://example.com"]}
+    
+    async def scenario(cache):
+        first, second = await asyncio.gather(
+            cache.call("research_person", "k1", fetch),
+            cache.call("research_person", "k1", fetch),
+        )
+        assert cache._inflight == {}  # Nothing is kept once the request resolves
+        again = await cache.call("research_person", "k1", fetch)
+        return first, second, again
+    
+    first, second, again = run_with_cache(tmp_path / "cache.db", scenario)
+    
+    assert len(calls) == 1
+    assert first == second == again == {"urls": ["https://example.com"]}
+
+
+def test_failure_is_shared_but_not_remembered(tmp_path):
+    """Waiters see the leader's error, and the next call tries again"""
+    calls = []
+    
+    async def failing_fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        raise ValueError("upstream unavailable")
+    
+    async def working_fetch():
+        calls.append(1)
+        return {"ok": True}
+    
+    async def scenario(cache):
+        results = await asyncio.gather(
+            cache.call("research_person", "k1", failing_fetch),
+            cache.call("research_person", "k1", failing_fetch),
+            return_exceptions=True,
+        )
+        assert cache._inflight == {}
+        retried = await cache.call("research_person", "k1", working_fetch)
+        return results, retried
+    
+    results, retried = run_with_cache(tmp_path / "cache.db", scenario)
+    
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(calls) == 2
+    assert retried == {"ok": True}
+
+
+def test_cancelled_waiter_does_not_cancel_shared_request(tmp_path):
+    """A waiter that gives up leaves the leader's request running"""
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+    
+    async def scenario(cache):
+        leader = asyncio.create_task(cache.call("research_person", "k1", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.call("research_person", "k1", fetch))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        return await leader
+    
+    assert run_with_cache(tmp_path / "cache.db", scenario) == {"ok": True}
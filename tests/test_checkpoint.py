@@ -0,0 +1,57 @@
+"""
+Tests for the rotating progress snapshots
+"""
+
+import orjson
+
+from checkpoint import ProgressRing, atomic_write
+
+
+def test_load_picks_highest_sequence(tmp_path):
+    """The newest readable slot wins and numbering continues after it"""
+    ring = ProgressRing(tmp_path / "progress.json")
+    for sequence in (3, 4, 5):
+        ring.slot(sequence).write_bytes(
+            orjson.dumps({"sequence": sequence, "current_index": sequence * 10})
+        )
+    # Simulate a torn write in the slot holding the newest snapshot
+    ring.slot(5).write_bytes(b'{"sequence": 5, "curr')
+    
+    progress = ring.load()
+    
+    assert progress["sequence"] == 4
+    assert progress["current_index"] == 40
+    assert ring.sequence == 5
+
+
+def test_load_without_snapshots(tmp_path):
+    """No snapshot files and no legacy file means a fresh start"""
+    assert ProgressRing(tmp_path / "progress.json").load() is None
+
+
+def test_load_falls_back_to_legacy_file(tmp_path):
+    """Progress written by older runs to the single file is still found"""
+    (tmp_path / "progress.json").write_bytes(orjson.dumps({"current_index": 7}))
+    assert ProgressRing(tmp_path / "progress.json").load() == {"current_index": 7}
+
+
+def test_claim_cycles_through_slots(tmp_path):
+    """Snapshots rotate over a fixed number of files"""
+    ring = ProgressRing(tmp_path / "progress.json", slots=3)
+    claimed = [ring.claim() for _ in range(4)]
+    
+    assert [sequence for sequence, _ in claimed] == [0, 1, 2, 3]
+    assert [path.name for _, path in claimed] == [
+        "progress.0.json", "progress.1.json", "progress.2.json", "progress.0.json"
+    ]
+
+
+def test_atomic_write_replaces_contents(tmp_path):
+    """The target holds the new data and no temp file is left behind"""
+    path = tmp_path / "progress.0.json"
+    path.write_bytes(b"old")
+    
+    atomic_write(path, b"new")
+    
+    assert path.read_bytes() == b"new"
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,86 @@
+"""
+Tests for the aiosqlite connection pool
+"""
+
+import asyncio
+
+import pytest
+
+from db_pool import AsyncConnectionPool
+
+
+class FakeConnection:
+    """Stands in for an aiosqlite connection; only close() is used by the pool"""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def make_factory(created):
+    async def factory():
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+    return factory
+
+
+def test_connection_is_reused():
+    """Sequential borrows get the same pooled connection back"""
+    async def run():
+        created = []
+        pool = AsyncConnectionPool(make_factory(created), min_size=1, max_size=4)
+        await pool.open()
+        async with pool.connection() as first:
+            pass
+        async with pool.connection() as second:
+            pass
+        assert first is second
+        assert len(created) == 1
+        await pool.close()
+        assert first.closed
+
+    asyncio.run(run())
+
+
+def test_cancelled_open_releases_slot():
+    """A borrow cancelled while its connection is opening frees the slot"""
+    async def run():
+        opening = asyncio.Event()
+
+        async def slow_factory():
+            opening.set()
+            await asyncio.sleep(3600)
+
+        pool = AsyncConnectionPool(slow_factory, min_size=0, max_size=1)
+
+        async def borrow():
+            async with pool.connection():
+                pass
+
+        task = asyncio.create_task(borrow())
+        await opening.wait()
+        assert pool._size == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert pool._size == 0
+
+    asyncio.run(run())
+
+
+def test_failed_open_releases_slot():
+    """A factory error propagates and does not leak a pool slot"""
+    async def run():
+        async def broken_factory():
+            raise OSError("disk unavailable")
+
+        pool = AsyncConnectionPool(broken_factory, min_size=0, max_size=1)
+        with pytest.raises(OSError):
+            async with pool.connection():
+                pass
+        assert pool._size == 0
+
+    asyncio.run(run())
@@ -0,0 +1,96 @@
+"""
+Tests for the processor's queue pipeline: resume watermark, pausing and stages
+"""
+
+import asyncio
+import csv
+import logging
+
+import process_full_csv_hardened as pipeline
+
+
+def test_mark_row_done_advances_over_contiguous_rows(processor):
+    """The watermark only moves past rows once every earlier row is done"""
+    processor._next_row = 1
+    processor._mark_row_done(2)
+    processor._mark_row_done(4)
+    assert processor._next_row == 1
+    
+    processor._mark_row_done(1)
+    assert processor._next_row == 3
+    assert processor._completed_rows == {4}
+    
+    processor._mark_row_done(3)
+    assert processor._next_row == 5
+    assert processor._completed_rows == set()
+
+
+def test_check_pause_announces_before_saving(processor, monkeypatch, caplog):
+    """The pause message is shown before the checkpoint is written"""
+    logged_before_save = []
+    
+    async def save_progress(self):
+        logged_before_save.extend(record.getMessage() for record in caplog.records)
+    
+    monkeypatch.setattr(pipeline.HardenedCompleteCSVProcessor, "save_progress", save_progress)
+    with caplog.at_level(logging.INFO, logger="enrich"):
+        asyncio.run(processor.check_pause())
+    
+    assert len(logged_before_save) == 1
+    assert "PAUSE detected" in logged_before_save[0]
+    assert "Delete PAUSE file to resume" in caplog.records[-1].getMessage()
+
+
+def run_pipeline(processor, names, slow_name=None):
+    """Run process_csv over contacts with these names; return (peak in flight, finish order)"""
+    with open(processor.csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Contact ID", "Full Name"])
+        writer.writerows((f"c{i}", name) for i, name in enumerate(names))
+    
+    in_flight = []
+    most_in_flight = 0
+    finished = []
+    
+    async def research_person(name, **kwargs):
+        nonlocal most_in_flight
+        in_flight.append(name)
+        most_in_flight = max(most_in_flight, len(in_flight))
+        await asyncio.sleep(0.6 if name == slow_name else 0.02)
+        in_flight.remove(name)
+        finished.append(name)
+        return {"urls": [], "confidence": "High"}
+    
+    processor._research_person = research_person
+    
+    async def run():
+        try:
+            await processor.process_csv()
+        finally:
+            await processor.aclose()
+    
+    asyncio.run(run())
+    assert processor.processed == len(names)
+    return most_in_flight, finished
+
+
+def test_steady_state_stays_at_worker_count(processor, monkeypatch):
+    """Without a stalled contact no more than `concurrency` run at once"""
+    monkeypatch.setattr(pipeline, "BURST_AFTER_SECS", 0.1)
+    processor.concurrency = 1
+    
+    most_in_flight, _ = run_pipeline(processor, ["Ann", "Bob", "Cy", "Di", "Ed"])
+    
+    assert most_in_flight == 1
+
+
+def test_stalled_contact_gets_burst_capacity(processor, monkeypatch):
+    """A stalled contact lets later ones run beside it, up to twice the workers"""
+    monkeypatch.setattr(pipeline, "BURST_AFTER_SECS", 0.1)
+    processor.concurrency = 1
+    
+    most_in_flight, finished = run_pipeline(processor, ["Slow", "Ann", "Bob", "Cy", "Di"], slow_name="Slow")
+    
+    assert most_in_flight == 2
+    # One burst slot, reused: each finished burst task frees it for the next contact
+    assert finished.index("Slow") >= 2
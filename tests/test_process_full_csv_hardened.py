@@ -0,0 +1,231 @@
+"""
+Tests for the hardened CSV enrichment processor
+"""
+
+import asyncio
+import csv
+import sqlite3
+import time
+
+import orjson
+import pytest
+
+import process_full_csv_hardened as pipeline
+
+
+def run_with_database(processor, scenario):
+    """Run a scenario against the processor's configured connection pool"""
+    async def run():
+        await processor.configure_database()
+        try:
+            return await scenario()
+        finally:
+            await processor.aclose()
+    return asyncio.run(run())
+
+
+def test_backup_database_copies_rows(processor, tmp_path):
+    """The backup is a readable copy of the campaign database"""
+    conn = sqlite3.connect(tmp_path / "campaign_local.db")
+    conn.execute("INSERT INTO contacts (original_contact_id) VALUES ('c1')")
+    conn.commit()
+    conn.close()
+
+    backup = processor.backup_database()
+
+    copy = sqlite3.connect(backup)
+    assert copy.execute("SELECT original_contact_id FROM contacts").fetchall() == [("c1",)]
+    copy.close()
+
+
+def test_backup_database_reuses_recent_backup_of_same_database(processor, tmp_path):
+    """A fresh backup of this database is reused; other databases' backups are not"""
+    (tmp_path / "other_backup_20240101_000000.db").write_bytes(b"")
+    first = processor.backup_database()
+    assert "other" not in first
+
+    assert processor.backup_database() == first
+
+
+def test_backup_database_missing_database_raises(processor, tmp_path):
+    """A missing database is an error and is not created empty"""
+    (tmp_path / "campaign_local.db").unlink()
+
+    with pytest.raises(sqlite3.OperationalError):
+        processor.backup_database()
+    assert not (tmp_path / "campaign_local.db").exists()
+
+
+def test_db_path_follows_local_database(tmp_path, monkeypatch):
+    """The processor opens the database file LocalDatabase is configured with"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(pipeline.LocalDatabase, "__init__", lambda self: setattr(self, "db_path", tmp_path / "other.db"))
+
+    processor = pipeline.HardenedCompleteCSVProcessor(csv_path="contacts.csv")
+
+    assert processor.db_path == str(tmp_path / "other.db")
+
+
+def failure_row(processor, contact_id, notes=""):
+    """A failure (sql, values) row as process_contact builds it"""
+    values = processor.contact_values({"original_contact_id": contact_id, "full_name": contact_id, "notes": notes})
+    return processor._failure_sql, values + ["failed", "boom", "now", "now", "batch", "test"]
+
+
+def stored_contact_ids(tmp_path):
+    conn = sqlite3.connect(tmp_path / "campaign_local.db")
+    rows = conn.execute("SELECT original_contact_id FROM contacts ORDER BY id").fetchall()
+    conn.close()
+    return [row[0] for row in rows]
+
+
+def test_insert_rows_writes_batch_in_one_transaction(processor, tmp_path):
+    """Every row of a clean batch is written"""
+    async def scenario():
+        async with processor.pool.connection() as conn:
+            await processor._insert_rows(conn, [failure_row(processor, f"c{i}") for i in range(3)])
+    
+    run_with_database(processor, scenario)
+    
+    assert processor.rows_written == 3
+    assert stored_contact_ids(tmp_path) == ["c0", "c1", "c2"]
+
+
+def test_insert_rows_falls_back_to_row_by_row(processor, tmp_path):
+    """One rejected row is dropped and the rest of its batch is still written"""
+    pending = [
+        failure_row(processor, "c0"),
+        failure_row(processor, "bad", notes="{not json"),
+        failure_row(processor, "c2"),
+    ]
+    
+    async def scenario():
+        async with processor.pool.connection() as conn:
+            await processor._insert_rows(conn, pending)
+            assert not conn.in_transaction
+    
+    run_with_database(processor, scenario)
+    
+    assert processor.rows_written == 2
+    assert stored_contact_ids(tmp_path) == ["c0", "c2"]
+
+
+def test_sanitize_json_csv_fields_escapes_only_invalid_json(processor):
+    """Valid JSON and empty values are kept; raw text becomes a JSON string"""
+    values = processor.contact_values({
+        "notes": "called twice, no answer",
+        "tags": '["donor", "volunteer"]',
+        "data_processing_consent_data": "",
+    })
+    
+    processor.sanitize_json_csv_fields(values)
+    
+    notes, tags, consent = (values[i] for i in processor._json_csv_indexes)
+    assert notes == '"called twice, no answer"'
+    assert orjson.loads(notes) == "called twice, no answer"
+    assert tags == '["donor", "volunteer"]'
+    assert consent == ""
+
+
+def write_contacts_csv(processor, rows):
+    """Write (contact id, name, notes) rows to the processor's CSV file"""
+    with open(processor.csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Contact ID", "Full Name", "Notes"])
+        writer.writerows(rows)
+
+
+def test_csv_rows_with_multi_line_notes_are_counted_once(processor):
+    """Quoted newlines inside a field do not create extra contacts"""
+    write_contacts_csv(processor, [
+        ("c1", "Ann", "first line\nsecond line"),
+        ("c2", "Bob", ""),
+        ("c3", "Cy", "a\n\nb"),
+    ])
+    
+    contacts = list(processor.iter_csv_contacts())
+    
+    assert processor.count_csv_contacts() == 3
+    assert [c["original_contact_id"] for c in contacts] == ["c1", "c2", "c3"]
+    assert [c["row_number"] for c in contacts] == [1, 2, 3]
+    assert contacts[2]["notes"] == "a\n\nb"
+
+
+def test_csv_skip_rows_and_limit(processor):
+    """Resuming skips leading rows and the limit caps how many follow"""
+    write_contacts_csv(processor, [(f"c{i}", f"Name {i}", "") for i in range(1, 6)])
+    
+    contacts = list(processor.iter_csv_contacts(skip_rows=1, limit=2))
+    
+    assert processor.count_csv_contacts(skip_rows=1, limit=2) == 2
+    assert [c["original_contact_id"] for c in contacts] == ["c2", "c3"]
+    assert [c["row_number"] for c in contacts] == [2, 3]
+    assert processor.count_csv_contacts(skip_rows=4, limit=10) == 1
+
+
+def start_writer(processor, total):
+    """Prepare the counters write_results reads when a run starts"""
+    processor.total_contacts = total
+    processor.start_mono = time.monotonic()
+    processor._next_row = 1
+    processor._stamp_batch()
+
+
+def test_write_results_flushes_full_and_partial_batches(processor, tmp_path):
+    """Rows are written every batch_size results and the remainder at the end"""
+    processor.batch_size = 2
+    start_writer(processor, total=3)
+    
+    async def scenario():
+        results = asyncio.Queue()
+        for row_number in (1, 2, 3):
+            results.put_nowait((row_number, False, failure_row(processor, f"c{row_number}")))
+        results.put_nowait(None)
+        await processor.write_results(results)
+    
+    run_with_database(processor, scenario)
+    
+    assert stored_contact_ids(tmp_path) == ["c1", "c2", "c3"]
+    assert processor.failed == 3
+    assert processor._next_row == 4
+
+
+def test_write_results_drains_buffer_when_cancelled(processor, tmp_path):
+    """Buffered rows reach the database even if the writer is cancelled"""
+    start_writer(processor, total=5)
+    
+    async def scenario():
+        results = asyncio.Queue()
+        writer = asyncio.create_task(processor.write_results(results))
+        await results.put((1, False, failure_row(processor, "c1")))
+        while not results.empty():
+            await asyncio.sleep(0)
+        assert len(processor._write_buf) == 1  # Below batch_size, so not flushed yet
+        writer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await writer
+    
+    run_with_database(processor, scenario)
+    
+    assert stored_contact_ids(tmp_path) == ["c1"]
+
+
+def test_already_enriched_contacts_are_not_counted(processor, tmp_path):
+    """Contacts completed by an earlier run are found in one query and skipped"""
+    conn = sqlite3.connect(tmp_path / "campaign_local.db")
+    conn.executemany(
+        "INSERT INTO contacts (original_contact_id, research_status) VALUES (?, ?)",
+        [("c1", "completed"), ("c2", "failed"), ("", "completed")],
+    )
+    conn.commit()
+    conn.close()
+    write_contacts_csv(processor, [(f"c{i}", f"Name {i}", "") for i in range(1, 5)])
+    
+    async def scenario():
+        return await processor.load_processed_ids()
+    
+    processed_ids = run_with_database(processor, scenario)
+    
+    assert processed_ids == {"c1"}
+    assert processor.count_csv_contacts(skip_ids=processed_ids) == 3
+    assert processor.count_csv_contacts(skip_rows=1, limit=2, skip_ids=processed_ids) == 2